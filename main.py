@@ -1,12 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 
 from middlewares import CustomHeaderMiddleware
+from src.database.db import engine
 from src.routes import contacts
 
-app = FastAPI()
+REDIS_URL = "redis://localhost:6379/0"
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    redis = aioredis.from_url(REDIS_URL)
+    FastAPICache.init(RedisBackend(redis), prefix="contacts")
+    yield
+    await redis.close()
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(contacts.router, prefix='/api')
 app.add_middleware(CustomHeaderMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.get("/")
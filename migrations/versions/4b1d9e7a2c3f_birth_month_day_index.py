@@ -0,0 +1,30 @@
+"""'Birth month-day index'
+
+Revision ID: 4b1d9e7a2c3f
+Revises: dc07f06e01e0
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d9e7a2c3f'
+down_revision: Union[str, None] = 'dc07f06e01e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_birth_mmdd',
+        'contacts',
+        [sa.text('(EXTRACT(MONTH FROM birth_date) * 100 + EXTRACT(DAY FROM birth_date))')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_birth_mmdd', table_name='contacts')
@@ -0,0 +1,37 @@
+"""'Birth mmdd column'
+
+Revision ID: c81d4f0a6e27
+Revises: a3f6c2e9b514
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81d4f0a6e27'
+down_revision: Union[str, None] = 'a3f6c2e9b514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BIRTH_MMDD = 'CAST(EXTRACT(MONTH FROM birth_date) * 100 + EXTRACT(DAY FROM birth_date) AS INTEGER)'
+
+
+def upgrade() -> None:
+    # Існуючі рядки заповнюються автоматично: стовпець генерується з birth_date.
+    op.drop_index('ix_contacts_birth_mmdd', table_name='contacts')
+    op.add_column('contacts', sa.Column('birth_mmdd', sa.Integer(), sa.Computed(BIRTH_MMDD, persisted=True)))
+    op.create_index(op.f('ix_contacts_birth_mmdd'), 'contacts', ['birth_mmdd'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contacts_birth_mmdd'), table_name='contacts')
+    op.drop_column('contacts', 'birth_mmdd')
+    op.create_index(
+        'ix_contacts_birth_mmdd',
+        'contacts',
+        [sa.text('(EXTRACT(MONTH FROM birth_date) * 100 + EXTRACT(DAY FROM birth_date))')]
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Computed, Index, Integer, String, Date, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -6,11 +6,26 @@ Base = declarative_base()
 
 class Contact(Base):
     __tablename__ = 'contacts'
+    __table_args__ = (
+        Index('ix_contacts_first_name_trgm', 'first_name',
+              postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}),
+        Index('ix_contacts_last_name_trgm', 'last_name',
+              postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}),
+        Index('ix_contacts_email_trgm', 'email',
+              postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
 
     id = Column(Integer, primary_key=True)
-    first_name = Column(String(15), nullable=False)
-    last_name = Column(String(15), nullable=False)
+    first_name = Column(String(15), nullable=False, index=True)
+    last_name = Column(String(15), nullable=False, index=True)
     email = Column(String, nullable=False, unique=True)
     contact_number = Column(String(20), nullable=False, unique=True)
     birth_date = Column(Date, nullable=False)
+    birth_mmdd = Column(
+        Integer,
+        Computed('CAST(EXTRACT(MONTH FROM birth_date) * 100 + EXTRACT(DAY FROM birth_date) AS INTEGER)',
+                 persisted=True),
+        index=True
+    )
     additional_information = Column(String(250), nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
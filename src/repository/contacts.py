@@ -1,86 +1,90 @@
 from fastapi import HTTPException
 from starlette import status
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import and_, or_, bindparam, case, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from typing import List, Tuple
 
 from src.schemas import ContactModel
 from src.database.models import Contact
 
+SELECT_CONTACT_BY_ID = select(Contact).where(Contact.id == bindparam("contact_id"))
 
-async def get_contacts(skip: int, limit: int, db: Session) -> List[Contact]:
-    return db.query(Contact).offset(skip).limit(limit).all()  # noqa
 
-
-async def get_contact(contact_id: int, db: Session) -> Contact:
-    return db.query(Contact).filter(Contact.id == contact_id).first()  # noqa
-
-
-async def create_contact(body: ContactModel, db: Session) -> Contact:
-    contact = Contact(first_name=body.first_name,
-                      last_name=body.last_name,
-                      email=body.email,
-                      contact_number=body.contact_number,
-                      birth_date=body.birth_date,
-                      additional_information=body.additional_information
-                      )
-    db.add(contact)
-    db.commit()
-    db.refresh(contact)
+async def get_contacts(skip: int, limit: int, db: AsyncSession) -> Tuple[List[Contact], int]:
+    """
+    Сторінка контактів разом із загальною кількістю (COUNT(*) OVER () в тому ж запиті).
+    """
+    stmt = (select(Contact, func.count().over().label('total'))
+            .options(load_only(Contact.id, Contact.first_name, Contact.last_name, Contact.email))
+            .offset(skip)
+            .limit(limit))
+    rows = (await db.execute(stmt)).all()
+    total = rows[0].total if rows else 0
+    return [row.Contact for row in rows], total
+
+
+async def get_contact(contact_id: int, db: AsyncSession) -> Contact:
+    contact = await db.execute(SELECT_CONTACT_BY_ID, {"contact_id": contact_id})
+    return contact.scalar_one_or_none()  # noqa
+
+
+def _contact_values(body: ContactModel) -> dict:
+    return dict(first_name=body.first_name,
+                last_name=body.last_name,
+                email=body.email,
+                contact_number=body.contact_number,
+                birth_date=body.birth_date,
+                additional_information=body.additional_information
+                )
+
+
+async def create_contact(body: ContactModel, db: AsyncSession) -> Contact:
+    stmt = insert(Contact).values(**_contact_values(body)).returning(Contact)
+    contact = (await db.execute(stmt)).scalar_one()
+    await db.commit()
     return contact
 
 
-async def update_contact(contact_id: int, body: ContactModel, db: Session) -> Contact | None:
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
-    if contact:
-        contact.first_name = body.first_name
-        contact.last_name = body.last_name
-        contact.email = body.email
-        contact.contact_number = body.contact_number
-        contact.birth_date = body.birth_date
-        contact.additional_information = body.additional_information
-        db.commit()
+async def update_contact(contact_id: int, body: ContactModel, db: AsyncSession) -> Contact | None:
+    stmt = update(Contact).where(Contact.id == contact_id).values(**_contact_values(body)).returning(Contact)
+    contact = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
     return contact
 
 
-async def remove_contact(contact_id: int, db: Session) -> Contact | None:
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+async def remove_contact(contact_id: int, db: AsyncSession) -> Contact | None:
+    contact = await get_contact(contact_id, db)
     if contact:
-        db.delete(contact)
-        db.commit()
+        await db.delete(contact)
+        await db.commit()
     return contact
 
 
-async def find_contact_by_first_name(contact_first_name: str, db: Session) -> List[Contact]:
-    """
-    Пошук контакту за іменем.
-    """
-    contact = db.query(Contact).filter(Contact.first_name == contact_first_name).all()
-    if not contact:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    else:
-        return contact  # noqa
-
-
-async def find_contact_by_last_name(contact_last_name: str, db: Session) -> List[Contact]:
-    """
-    Пошук контакту за прізвищем.
-    """
-    contact = db.query(Contact).filter(Contact.last_name == contact_last_name).all()
-    if not contact:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    else:
-        return contact  # noqa
+def _prefix_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
 
 
-async def find_contact_by_email(contact_email: str, db: Session) -> List[Contact]:
+async def search_contacts(db: AsyncSession,
+                          first_name: str | None = None,
+                          last_name: str | None = None,
+                          email: str | None = None) -> List[Contact]:
     """
-        Пошук контакту за адресою електронної пошти.
+    Пошук контактів за початком імені, прізвища та/або адреси електронної пошти (без урахування регістру).
     """
-    contact = db.query(Contact).filter(Contact.email == contact_email).all()
-    if not contact:
+    conditions = []
+    if first_name:
+        conditions.append(Contact.first_name.ilike(_prefix_pattern(first_name), escape="\\"))
+    if last_name:
+        conditions.append(Contact.last_name.ilike(_prefix_pattern(last_name), escape="\\"))
+    if email:
+        conditions.append(Contact.email.ilike(_prefix_pattern(email), escape="\\"))
+
+    contacts = (await db.execute(select(Contact).where(and_(*conditions)))).scalars().all()
+    if not contacts:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    else:
-        return contact  # noqa
+    return contacts  # noqa
 
 
 """
@@ -88,18 +92,19 @@ API повинен мати змогу отримати список конта
 """
 
 
-async def upcoming_birthdays(current_date, to_date, skip: int, limit: int, db: Session) -> List[Contact]:
-    contacts = db.query(Contact).offset(skip).limit(limit).all()
-
-    upcoming = []
+async def upcoming_birthdays(current_date, to_date, skip: int, limit: int, db: AsyncSession) -> List[Contact]:
+    start = current_date.month * 100 + current_date.day
+    end = to_date.month * 100 + to_date.day
 
-    for contact in contacts:
-
-        contact_birthday_month_day = (contact.birth_date.month, contact.birth_date.day)
-        current_date_month_day = (current_date.month, current_date.day)
-        to_date_month_day = (to_date.month, to_date.day)
+    if start <= end:
+        condition = and_(Contact.birth_mmdd > start, Contact.birth_mmdd <= end)
+    else:
+        # Період переходить через Новий рік (грудень -> січень).
+        condition = or_(Contact.birth_mmdd > start, Contact.birth_mmdd <= end)
 
-        if current_date_month_day < contact_birthday_month_day <= to_date_month_day:
-            upcoming.append(contact)
+    # Стабільний порядок для пагінації: від найближчого дня народження, з урахуванням переходу через рік.
+    order = (case((Contact.birth_mmdd > start, 0), else_=1), Contact.birth_mmdd, Contact.id)
 
-    return upcoming  # noqa
+    stmt = select(Contact).where(condition).order_by(*order).offset(skip).limit(limit)
+    contacts = await db.execute(stmt)
+    return contacts.scalars().all()  # noqa
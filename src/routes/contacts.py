@@ -1,43 +1,169 @@
+import hashlib
+import logging
+import os
 import pathlib
+import tempfile
 from datetime import date, timedelta
-from fastapi import APIRouter, HTTPException, Depends, status, Query, Path, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
+import aiofiles
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Path, UploadFile, File, Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable, List
 
 from src.database.db import get_db
 from src.database.models import Contact
 from src.repository import contacts as repository_contacts
-from src.schemas import ContactModel, ContactResponse
+from src.schemas import ContactListItem, ContactModel, ContactPage, ContactResponse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix='/contacts')
 
+CONTACTS_LIST_NAMESPACE = "contacts:list"
+CONTACTS_ONE_NAMESPACE = "contacts:one"
+
+
+def contacts_key_builder(func: Callable[..., Any], namespace: str = "", *, args: tuple = (),
+                         kwargs: dict | None = None, **_: Any) -> str:
+    """
+    Ключ кешу з параметрів запиту без сесії бази даних.
+    fastapi-cache2 0.2.2 передає namespace вже з префіксом, як і в default_key_builder.
+    """
+    params = {key: value for key, value in (kwargs or {}).items() if key != "db"}
+    cache_key = hashlib.md5(f"{func.__module__}:{func.__name__}:{args}:{params}".encode()).hexdigest()
+    return f"{namespace}:{cache_key}"
+
+
+async def clear_contacts_cache() -> None:
+    """
+    Очищення кешу читання після зміни контактів.
+    """
+    try:
+        await FastAPICache.clear(namespace=CONTACTS_LIST_NAMESPACE)
+        await FastAPICache.clear(namespace=CONTACTS_ONE_NAMESPACE)
+    except Exception:
+        # Зміни вже збережено в базі даних, тому недоступний кеш не має ламати відповідь.
+        logger.warning("Error clearing contacts cache:", exc_info=True)
+
+
+async def check_unique_fields(body: ContactModel, db: AsyncSession, exclude_id: int | None = None) -> None:
+    """
+    Перевірка унікальності електронної пошти та номера телефону одним запитом.
+    """
+    email_condition = Contact.email == body.email
+    number_condition = Contact.contact_number == body.contact_number
+    if exclude_id is not None:
+        email_condition &= Contact.id != exclude_id
+        number_condition &= Contact.id != exclude_id
+
+    stmt = select(exists().where(email_condition).label('email_taken'),
+                  exists().where(number_condition).label('number_taken'))
+    email_taken, number_taken = (await db.execute(stmt)).one()
+
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact with the mentioned email already exists."
+        )
+
+    if number_taken:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Contact with the mentioned contact number already exists."
+        )
+
+
 """
-Отримати список всіх контактів.
+Отримати сторінку контактів разом із загальною кількістю.
 Валідація не відбувається.
 """
 
 
-@router.get("/", response_model=List[ContactResponse], tags=['Contacts'])
-async def get_contacts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    contacts = await repository_contacts.get_contacts(skip, limit, db)
-    return contacts
+@router.get("/", response_model=ContactPage, tags=['Contacts'])
+@cache(expire=30, namespace=CONTACTS_LIST_NAMESPACE, key_builder=contacts_key_builder)
+async def get_contacts(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    contacts, total = await repository_contacts.get_contacts(skip, limit, db)
+    return ContactPage(items=[ContactListItem.model_validate(contact) for contact in contacts], total=total)
+
+
+"""
+Контакти повинні бути доступні для пошуку за початком імені, прізвища чи адреси електронної пошти (Query).
+Параметри можна поєднувати.
+Валідація:
+1) Чи існує контакт з вказаним параметром(ім'ям, прізвищем або електронною адресою) в базі даних? (repository func)
+"""
+
+
+@router.put("/search/{contact_id}", response_model=List[ContactResponse], tags=['Contacts'])
+async def find_contact(contact_first_name: str = Query(None),
+                       contact_last_name: str = Query(None),
+                       contact_email: str = Query(None),
+                       db: AsyncSession = Depends(get_db)):
+    if not (contact_first_name or contact_last_name or contact_email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You must provide at least one parameter"
+        )
+    return await repository_contacts.search_contacts(db,
+                                                     first_name=contact_first_name,
+                                                     last_name=contact_last_name,
+                                                     email=contact_email)
+
+
+"""
+API повинен мати змогу отримати список контактів з днями народження на найближчі 7 днів.
+Валідація не відбувається.
+"""
+
+
+@router.get("/birthdays/", response_model=List[ContactResponse], tags=['Birthdays'])
+async def get_upcoming_birthdays(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    current_date = date.today()
+    to_date = current_date + timedelta(days=7)
+
+    birthdays = await repository_contacts.upcoming_birthdays(current_date, to_date, skip, limit, db)
+    return birthdays
 
 
 """
 Отримати один контакт за ідентифікатором.
+Відповідь містить ETag; при збігу з If-None-Match повертається 304 без тіла.
 Валідація:
 1) Чи існує контакт в базі даних?
 """
 
 
-@router.get("/{contact_id}", response_model=ContactResponse, tags=['Contacts'])
-async def get_contact(contact_id: int = Path(ge=1), db: Session = Depends(get_db)):
+@cache(expire=60, namespace=CONTACTS_ONE_NAMESPACE, key_builder=contacts_key_builder)
+async def get_cached_contact(contact_id: int, db: AsyncSession) -> ContactResponse | None:
     contact = await repository_contacts.get_contact(contact_id, db)
+    return ContactResponse.model_validate(contact) if contact else None
+
+
+def contact_etag(contact: ContactResponse) -> str:
+    version = int(contact.updated_at.timestamp() * 1_000_000) if contact.updated_at else 0
+    return f'W/"{contact.id}-{version}"'
+
+
+@router.get("/{contact_id}", response_model=ContactResponse, tags=['Contacts'])
+async def get_contact(request: Request, response: Response, contact_id: int = Path(ge=1),
+                      db: AsyncSession = Depends(get_db)):
+    cached = await get_cached_contact(contact_id=contact_id, db=db)
+    # При влучанні в кеш fastapi-cache повертає розкодований dict, а не модель.
+    contact = ContactResponse.model_validate(cached) if cached else None
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
+
+    etag = contact_etag(contact)
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return contact
 
 
@@ -52,23 +178,12 @@ async def get_contact(contact_id: int = Path(ge=1), db: Session = Depends(get_db
 
 
 @router.post("/", response_model=ContactResponse, tags=['Contacts'])
-async def create_contact(body: ContactModel, db: Session = Depends(get_db)):
-    contact_email = db.query(Contact).filter_by(email=body.email).first()
-    contact_number = db.query(Contact).filter_by(contact_number=body.contact_number).first()
-
-    if contact_email:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Contact with the mentioned email already exists."
-        )
+async def create_contact(body: ContactModel, db: AsyncSession = Depends(get_db)):
+    await check_unique_fields(body, db)
 
-    if contact_number:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Contact with the mentioned contact number already exists."
-        )
-
-    return await repository_contacts.create_contact(body, db)
+    contact = await repository_contacts.create_contact(body, db)
+    await clear_contacts_cache()
+    return contact
 
 
 """
@@ -77,36 +192,25 @@ async def create_contact(body: ContactModel, db: Session = Depends(get_db)):
 1) Чи відповідає номер формату? (schemas.py)
 1) Чи день народження в майбутньому? (schemas.py)
 2) Чи відповідає електронна адреса формату? (schemas.py)
-3) Чи існує контакт в базі даних?
-4) Чи існує контакт з надісланою електронною поштою?
-5) Чи існує контакт з надісланим номером телефону?
+3) Чи існує контакт з надісланою електронною поштою?
+4) Чи існує контакт з надісланим номером телефону?
+5) Чи існує контакт в базі даних?
 
 """
 
 
 @router.put("/{contact_id}", response_model=ContactResponse, tags=['Contacts'])
-async def update_contact(body: ContactModel, contact_id: int = Path(ge=1), db: Session = Depends(get_db)):
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+async def update_contact(body: ContactModel, contact_id: int = Path(ge=1), db: AsyncSession = Depends(get_db)):
+    await check_unique_fields(body, db, exclude_id=contact_id)
+
+    # Рядок не завантажується заздалегідь: інакше UPDATE ... RETURNING повернув би
+    # вже наявний у сесії об'єкт із застарілими updated_at та birth_mmdd.
+    contact = await repository_contacts.update_contact(contact_id, body, db)
 
     if contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
 
-    contact_email = db.query(Contact).filter_by(email=body.email).first()
-    contact_number = db.query(Contact).filter_by(contact_number=body.contact_number).first()
-
-    if contact_email:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Contact with the mentioned email already exists."
-        )
-
-    if contact_number:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Contact with the mentioned contact number already exists."
-        )
-
-    contact = await repository_contacts.update_contact(contact_id, body, db)
+    await clear_contacts_cache()
 
     return contact
 
@@ -119,81 +223,56 @@ async def update_contact(body: ContactModel, contact_id: int = Path(ge=1), db: S
 
 
 @router.delete("/{contact_id}", response_model=ContactResponse, tags=['Contacts'])
-async def remove_contact(contact_id: int = Path(ge=1), db: Session = Depends(get_db)):
+async def remove_contact(contact_id: int = Path(ge=1), db: AsyncSession = Depends(get_db)):
     contact = await repository_contacts.remove_contact(contact_id, db)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
+    await clear_contacts_cache()
     return contact
 
 
-"""
-Контакти повинні бути доступні для пошуку за іменем, прізвищем чи адресою електронної пошти (Query).
-Валідація:
-1) Чи існує контакт з вказаним параметром(ім'ям, прізвищем або електронною адресою) в базі даних? (repository func)
-"""
-
-
-@router.put("/search/{contact_id}", response_model=List[ContactResponse], tags=['Contacts'])
-async def find_contact(contact_first_name: str = Query(None),
-                       contact_last_name: str = Query(None),
-                       contact_email: str = Query(None),
-                       db: Session = Depends(get_db)):
-    if contact_first_name:
-        return await repository_contacts.find_contact_by_first_name(contact_first_name, db)
-    elif contact_last_name:
-        return await repository_contacts.find_contact_by_last_name(contact_last_name, db)
-    elif contact_email:
-        return await repository_contacts.find_contact_by_email(contact_email, db)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You must provide at least one parameter"
-        )
-
-
-"""
-API повинен мати змогу отримати список контактів з днями народження на найближчі 7 днів.
-Валідація не відбувається.
-"""
-
-
-@router.get("/birthdays/", response_model=List[ContactResponse], tags=['Birthdays'])
-async def get_upcoming_birthdays(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    current_date = date.today()
-    to_date = current_date + timedelta(days=7)
-
-    birthdays = await repository_contacts.upcoming_birthdays(current_date, to_date, skip, limit, db)
-    return birthdays
-
-
 """
 Завантаження файлу.
 """
 
 MAX_FILE_SIZE = 1_000_000
+MULTIPART_OVERHEAD = 16_384
+CHUNK_SIZE = 64 * 1024
 
 
 @router.post("/upload-file/", tags=['Upload File'])
-async def upload_file(file: UploadFile = File()):
+async def upload_file(request: Request, file: UploadFile = File()):
+    content_length = request.headers.get("content-length")
+    too_large_request = (content_length and content_length.isdigit()
+                         and int(content_length) > MAX_FILE_SIZE + MULTIPART_OVERHEAD)
+    if too_large_request or (file.size is not None and file.size > MAX_FILE_SIZE):
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large, max size is {MAX_FILE_SIZE} bytes"
+        )
+
     pathlib.Path("uploads").mkdir(exist_ok=True)
     file_path = f"uploads/{file.filename}"
+    tmp_fd, tmp_path = tempfile.mkstemp(dir="uploads", suffix=".tmp")
+
+    try:
+        file_size = 0
+        async with aiofiles.open(tmp_fd, "wb") as f:
+            while chunk := await file.read(CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large, max size is {MAX_FILE_SIZE} bytes"
+                    )
+                await f.write(chunk)
+
+        os.replace(tmp_path, file_path)
+    finally:
+        # Після успішного os.replace тимчасового файлу вже немає.
+        pathlib.Path(tmp_path).unlink(missing_ok=True)
 
-    file_size = 0
-    with open(file_path, "wb") as f:
-        while True:
-            chunk = await file.read(1024)
-            if not chunk:
-                break
-            file_size += len(chunk)
-            if file_size > MAX_FILE_SIZE:
-                f.close()
-                pathlib.Path(file_path).unlink()
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"File too large, max size is {MAX_FILE_SIZE} bytes"
-                )
-            f.write(chunk)
     return {"file_path": file_path}
@@ -1,23 +1,27 @@
-from datetime import date
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 
 from fastapi import HTTPException, status
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, field_validator
 import re
 
+PHONE_NUMBER_PATTERN = re.compile(r'^(\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}$')
+
 
 class ContactModel(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     first_name: str = Field(max_length=15)
     last_name: str = Field(max_length=15)
     email: EmailStr
     contact_number: str
     birth_date: date
-    additional_information: str = Optional[str]
+    additional_information: Optional[str] = Field(default=None, max_length=250)
 
     @field_validator('contact_number')  # noqa
     @classmethod
     def validate_contact_number(cls, value: str) -> str:
-        if not re.match(r'^(\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}$', value):
+        if not PHONE_NUMBER_PATTERN.match(value):
             """
             Matching formats:
             123-456-7890
@@ -39,7 +43,21 @@ class ContactModel(BaseModel):
 
 
 class ContactResponse(ContactModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
+    updated_at: Optional[datetime] = None
+
+
+class ContactListItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    first_name: str
+    last_name: str
+    email: EmailStr
+
 
-    class Config:
-        orm_mode = True
+class ContactPage(BaseModel):
+    items: List[ContactListItem]
+    total: int
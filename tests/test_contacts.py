@@ -0,0 +1,152 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from main import app
+from src.database.db import get_db
+from src.repository import contacts as repository_contacts
+from src.routes import contacts as routes_contacts
+
+
+async def override_get_db():
+    yield None
+
+
+def make_contact(**overrides):
+    fields = dict(id=1,
+                  first_name="Andrii",
+                  last_name="Kovalchuk",
+                  email="andrii@example.com",
+                  contact_number="123-456-7890",
+                  birth_date=date(1990, 5, 17),
+                  additional_information=None,
+                  updated_at=datetime(2026, 10, 14, 13, 48, 20))
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    backend = InMemoryBackend()
+    backend._store = {}  # сховище InMemoryBackend спільне для всіх екземплярів
+    FastAPICache.init(backend, prefix="contacts")
+    app.dependency_overrides[get_db] = override_get_db
+    calls = []
+
+    async def fake_get_contact(contact_id, db):
+        calls.append(contact_id)
+        return make_contact(id=contact_id)
+
+    monkeypatch.setattr(repository_contacts, "get_contact", fake_get_contact)
+    yield TestClient(app), calls
+    app.dependency_overrides.clear()
+    FastAPICache.reset()
+
+
+def test_get_contact_twice_is_served_from_cache(client):
+    test_client, calls = client
+
+    first = test_client.get("/api/contacts/1")
+    second = test_client.get("/api/contacts/1")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert calls == [1]
+
+
+def test_get_contact_not_modified(client):
+    test_client, _ = client
+
+    etag = test_client.get("/api/contacts/1").headers["ETag"]
+    response = test_client.get("/api/contacts/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_cache_keys_follow_prefix_and_namespace(client):
+    # contacts_key_builder спирається на непублічний контракт fastapi-cache2,
+    # тому формат ключа перевіряється проти встановленої версії.
+    test_client, _ = client
+
+    test_client.get("/api/contacts/1")
+    keys = list(FastAPICache.get_backend()._store)
+
+    expected_prefix = f"{FastAPICache.get_prefix()}:{routes_contacts.CONTACTS_ONE_NAMESPACE}:"
+    assert len(keys) == 1
+    assert keys[0].startswith(expected_prefix)
+    assert ":" not in keys[0][len(expected_prefix):]
+
+
+def test_remove_contact_clears_cached_contact(client, monkeypatch):
+    test_client, calls = client
+
+    async def fake_remove_contact(contact_id, db):
+        return make_contact(id=contact_id)
+
+    monkeypatch.setattr(repository_contacts, "remove_contact", fake_remove_contact)
+
+    test_client.get("/api/contacts/1")
+    assert test_client.delete("/api/contacts/1").status_code == 200
+    test_client.get("/api/contacts/1")
+
+    assert calls == [1, 1]
+
+
+def test_remove_contact_survives_cache_backend_errors(client, monkeypatch):
+    test_client, _ = client
+
+    async def fake_remove_contact(contact_id, db):
+        return make_contact(id=contact_id)
+
+    async def failing_clear(namespace=None, key=None):
+        raise ConnectionError("Redis is unavailable")
+
+    monkeypatch.setattr(repository_contacts, "remove_contact", fake_remove_contact)
+    monkeypatch.setattr(FastAPICache.get_backend(), "clear", failing_clear)
+
+    assert test_client.delete("/api/contacts/1").status_code == 200
+
+
+def test_update_contact_uses_update_result(client, monkeypatch):
+    test_client, calls = client
+    updated = make_contact(updated_at=datetime(2026, 10, 14, 13, 48, 21))
+
+    async def fake_check_unique_fields(body, db, exclude_id=None):
+        return None
+
+    async def fake_update_contact(contact_id, body, db):
+        return updated if contact_id == 1 else None
+
+    monkeypatch.setattr(routes_contacts, "check_unique_fields", fake_check_unique_fields)
+    monkeypatch.setattr(repository_contacts, "update_contact", fake_update_contact)
+    body = {key: str(value) if isinstance(value, date) else value
+            for key, value in vars(make_contact()).items() if key not in ("id", "updated_at")}
+
+    response = test_client.put("/api/contacts/1", json=body)
+    missing = test_client.put("/api/contacts/2", json=body)
+
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == "2026-10-14T13:48:21"
+    assert missing.status_code == 404
+    assert calls == []
+
+
+def test_upload_file_leaves_no_temp_files(client, tmp_path, monkeypatch):
+    test_client, _ = client
+    monkeypatch.chdir(tmp_path)
+
+    response = test_client.post("/api/contacts/upload-file/", files={"file": ("notes.txt", b"hello")})
+    too_large = test_client.post("/api/contacts/upload-file/",
+                                 files={"file": ("big.txt", b"x" * (routes_contacts.MAX_FILE_SIZE + 1))})
+
+    assert response.status_code == 200
+    assert (tmp_path / "uploads" / "notes.txt").read_bytes() == b"hello"
+    assert too_large.status_code == 413
+    assert sorted(path.name for path in (tmp_path / "uploads").iterdir()) == ["notes.txt"]